@@ -5,14 +5,33 @@ Monitors nginx logs for Blue/Green deployment events and sends Slack alerts
 """
 
 import json
+import re
 import time
 import os
 import logging
-import threading
+import asyncio
+import functools
 from collections import deque
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-import requests
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
+import httpx
+import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Fall back to the stdlib parser
+    _loads = json.loads
+
+try:
+    from numba import njit
+except ImportError:  # Kernel runs as plain Python
+    njit = None
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Non-Linux hosts fall back to polling
+    INotify = None
 
 # Configure logging
 logging.basicConfig(
@@ -21,65 +40,129 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 1 << 17  # Max bytes copied per read() syscall
+ALERT_QUEUE_SIZE = 256  # Pending Slack alerts before new ones are dropped
+ALERT_BATCH_WINDOW = 0.25  # Seconds to collect alerts into one batch
+ALERT_BATCH_SIZE = 20  # Max alerts collected into one batch
+SLACK_MAX_RETRIES = 3  # Extra attempts on rate limiting or server errors
+SLACK_RETRY_BACKOFF = 0.2  # Base seconds between retries, doubled each time
+SLACK_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_POOL_SET = frozenset(('blue', 'green'))  # Valid upstream pool names
+
+# Fast path for the nginx observability log_format, which emits status and
+# pool adjacently. The leading comma keeps it from matching escaped text
+# inside earlier string fields such as the URI.
+_FAST_FIELDS = re.compile(rb',\s*"status"\s*:\s*"?(\d+)"?\s*,\s*"pool"\s*:\s*"([^"\\]*)"')
+
+def squash_payloads(items: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[Dict[str, Any], int]]:
+    """
+    Collapse queued alerts of the same type into a single message
+    Returns: (latest message, count) per alert type in first-seen order
+    """
+    buckets: Dict[str, List] = {}
+    for alert_type, message in items:
+        bucket = buckets.get(alert_type)
+        if bucket is None:
+            buckets[alert_type] = [message, 1]
+        else:
+            bucket[0] = message
+            bucket[1] += 1
+    return [(message, count) for message, count in buckets.values()]
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(epoch_seconds: int) -> str:
+    """Format a Slack timestamp, reused for every alert in the same second"""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+def _add_request_kernel(ring, head: int, count: int, error_count: int,
+                        window_size: int, status_code: int) -> tuple:
+    """
+    Record one request in the error ring buffer
+    Returns: (head, count, error_count)
+    """
+    is_error = 1 if status_code >= 500 else 0
+    if count == window_size:
+        error_count -= int(ring[head])
+    else:
+        count += 1
+    ring[head] = is_error
+    error_count += is_error
+    head = (head + 1) % window_size
+    return head, count, error_count
+
+if njit is not None:
+    _add_request_kernel = njit(cache=True)(_add_request_kernel)
+
 class AlertManager:
-    """Manages alert cooldowns and deduplication"""
+    """
+    Manages alert cooldowns and deduplication
+    Single-writer: only the log tail loop calls should_alert. Updates publish
+    a new last_alerts dict instead of mutating it, so readers can take a
+    consistent snapshot with a plain attribute read and no lock.
+    """
     
     def __init__(self, cooldown_seconds: int = 300):
-        self.cooldown_seconds = cooldown_seconds
-        self.last_alerts = {}
-        self.lock = threading.Lock()
+        self.cooldown_seconds = float(cooldown_seconds)
+        self.last_alerts: Dict[str, float] = {}  # Monotonic timestamps
     
     def should_alert(self, alert_type: str) -> bool:
         """Check if enough time has passed since last alert of this type"""
-        with self.lock:
-            now = datetime.now()
-            last_time = self.last_alerts.get(alert_type)
-            
-            if last_time is None:
-                self.last_alerts[alert_type] = now
-                return True
-            
-            if now - last_time > timedelta(seconds=self.cooldown_seconds):
-                self.last_alerts[alert_type] = now
-                return True
-            
-            return False
+        now = time.monotonic()
+        last_time = self.last_alerts.get(alert_type)
+        
+        if last_time is None or now - last_time > self.cooldown_seconds:
+            last_alerts = self.last_alerts.copy()
+            last_alerts[alert_type] = now
+            self.last_alerts = last_alerts  # Atomic rebind
+            return True
+        
+        return False
 
 class PoolTracker:
-    """Tracks current active pool and detects failovers"""
+    """
+    Tracks current active pool and detects failovers
+    Single-writer: only the log tail loop calls update_pool
+    """
     
     def __init__(self):
         self.current_pool = None
         self.last_seen_pools = deque(maxlen=10)  # Track recent pools
-        self.lock = threading.Lock()
     
     def update_pool(self, pool: Optional[str]) -> Optional[str]:
         """Update current pool and return previous pool if changed"""
         if not pool:
             return None
             
-        with self.lock:
-            previous_pool = self.current_pool
-            
-            # Only update if we have a valid pool name
-            if pool in ['blue', 'green']:
-                self.current_pool = pool
-                self.last_seen_pools.append(pool)
-                
-                # Return previous only if there was an actual change
-                if previous_pool and previous_pool != pool:
-                    return previous_pool
+        previous_pool = self.current_pool
+        
+        # Only update if we have a valid pool name
+        if pool in _POOL_SET:
+            self.current_pool = pool
+            self.last_seen_pools.append(pool)
             
-            return None
+            # Return previous only if there was an actual change
+            if previous_pool and previous_pool != pool:
+                return previous_pool
+        
+        return None
 
 class ErrorRateMonitor:
-    """Monitors error rates over a sliding window"""
+    """
+    Monitors error rates over a sliding window
+    Single-writer: only the log tail loop calls add_request. Readers
+    use get_current_stats, which reads an immutable snapshot published by the
+    writer, so neither side needs a lock under the GIL.
+    """
     
     def __init__(self, window_size: int = 200, threshold_percent: float = 2.0):
         self.window_size = window_size
         self.threshold_percent = threshold_percent
-        self.requests = deque(maxlen=window_size)
-        self.lock = threading.Lock()
+        # Ring buffer of one byte per request (1 = 5xx) plus a running count
+        self.ring = np.zeros(window_size, dtype=np.uint8)
+        self.head = 0
+        self.count = 0
+        self.error_count = 0
+        self._stats_snapshot = (0, 0, 0.0)  # (total, errors, error_rate)
         self.in_error_state = False  # Track if we're currently in error state
         self.recovery_threshold = 0.5  # Must drop below 0.5% to consider recovered
     
@@ -88,50 +171,92 @@ class ErrorRateMonitor:
         Add a request and check thresholds
         Returns: (exceeded_threshold, recovered_from_error)
         """
-        with self.lock:
-            self.requests.append(status_code)
-            
-            # Need at least 50 requests before checking error rate
-            if len(self.requests) < 50:
-                return False, False
-            
-            error_count = sum(1 for status in self.requests if status >= 500)
-            error_rate = (error_count / len(self.requests)) * 100
-            
-            # Check if threshold exceeded
-            exceeded = error_rate > self.threshold_percent
-            
-            # Check for recovery (was in error state, now below recovery threshold)
-            recovered = False
-            if self.in_error_state and error_rate < self.recovery_threshold:
-                recovered = True
-                self.in_error_state = False
-            elif exceeded:
-                self.in_error_state = True
-            
-            return exceeded, recovered
+        self.head, self.count, self.error_count = _add_request_kernel(
+            self.ring, self.head, self.count, self.error_count,
+            self.window_size, status_code
+        )
+        return self._check_thresholds()
+    
+    def add_requests_bulk(self, status_codes: np.ndarray) -> tuple:
+        """
+        Add a batch of requests and check thresholds once for the batch
+        Returns: (exceeded_threshold, recovered_from_error)
+        """
+        is_error = (status_codes >= 500).astype(np.uint8)
+        n = len(is_error)
+        if n == 0:
+            return False, False
+        
+        self.count = min(self.count + n, self.window_size)
+        
+        # Entries older than one window would be overwritten within the batch
+        if n > self.window_size:
+            self.head = (self.head + n - self.window_size) % self.window_size
+            is_error = is_error[-self.window_size:]
+            n = self.window_size
+        
+        # Adjust the running count by the overwritten and new slots only -
+        # unfilled slots are zero, so subtracting them is harmless
+        index = (self.head + np.arange(n)) % self.window_size
+        self.error_count -= int(np.count_nonzero(self.ring[index]))
+        self.ring[index] = is_error
+        self.error_count += int(np.count_nonzero(is_error))
+        self.head = (self.head + n) % self.window_size
+        
+        return self._check_thresholds()
+    
+    def _check_thresholds(self) -> tuple:
+        """Publish current stats and evaluate error/recovery thresholds"""
+        error_rate = (self.error_count / self.count) * 100
+        
+        # Publish for readers - a single tuple rebind is atomic
+        self._stats_snapshot = (self.count, self.error_count, error_rate)
+        
+        # Need at least 50 requests before checking error rate
+        if self.count < 50:
+            return False, False
+        
+        # Check if threshold exceeded
+        exceeded = error_rate > self.threshold_percent
+        
+        # Check for recovery (was in error state, now below recovery threshold)
+        recovered = False
+        if self.in_error_state and error_rate < self.recovery_threshold:
+            recovered = True
+            self.in_error_state = False
+        elif exceeded:
+            self.in_error_state = True
+        
+        return exceeded, recovered
     
     def get_current_stats(self) -> Dict[str, Any]:
         """Get current error rate statistics"""
-        with self.lock:
-            if not self.requests:
-                return {"total": 0, "errors": 0, "error_rate": 0.0}
-            
-            error_count = sum(1 for status in self.requests if status >= 500)
-            total_count = len(self.requests)
-            error_rate = (error_count / total_count) * 100
-            
-            return {
-                "total": total_count,
-                "errors": error_count,
-                "error_rate": round(error_rate, 2)
-            }
+        total_count, error_count, error_rate = self._stats_snapshot
+        
+        return {
+            "total": total_count,
+            "errors": error_count,
+            "error_rate": round(error_rate, 2)
+        }
 
 class SlackNotifier:
-    """Sends notifications to Slack"""
+    """Sends notifications to Slack from a background asyncio task"""
     
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
+        
+        # One pooled keep-alive client for all alerts. The transport retries
+        # failed connects; status-based retries are done in _send_message.
+        self.http = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=SLACK_MAX_RETRIES,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+            ),
+            timeout=httpx.Timeout(10.0, connect=3.0)
+        )
+        self.alert_queue = asyncio.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._worker_task = None
     
     def send_failover_alert(self, previous_pool: str, current_pool: str):
         """Send failover detection alert"""
@@ -148,7 +273,7 @@ class SlackNotifier:
                         },
                         {
                             "title": "Timestamp",
-                            "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                            "value": _format_timestamp(int(time.time())),
                             "short": True
                         },
                         {
@@ -160,7 +285,7 @@ class SlackNotifier:
                 }
             ]
         }
-        self._send_message(message)
+        self._enqueue('failover', message)
     
     def send_error_rate_alert(self, stats: Dict[str, Any]):
         """Send high error rate alert"""
@@ -182,7 +307,7 @@ class SlackNotifier:
                         },
                         {
                             "title": "Timestamp",
-                            "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                            "value": _format_timestamp(int(time.time())),
                             "short": True
                         },
                         {
@@ -194,7 +319,7 @@ class SlackNotifier:
                 }
             ]
         }
-        self._send_message(message)
+        self._enqueue('error_rate', message)
     
     def send_recovery_alert(self, current_pool: str):
         """Send recovery notification"""
@@ -211,26 +336,64 @@ class SlackNotifier:
                         },
                         {
                             "title": "Timestamp",
-                            "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
+                            "value": _format_timestamp(int(time.time())),
                             "short": True
                         }
                     ]
                 }
             ]
         }
-        self._send_message(message)
+        self._enqueue('recovery', message)
+    
+    def start(self):
+        """Start the alert worker on the running event loop"""
+        self._worker_task = asyncio.create_task(self._alert_worker())
     
-    def _send_message(self, message: Dict[str, Any]):
-        """Send message to Slack webhook"""
+    async def close(self):
+        """Stop the alert worker and close pooled connections"""
+        if self._worker_task:
+            self._worker_task.cancel()
+        await self.http.aclose()
+    
+    def _enqueue(self, alert_type: str, message: Dict[str, Any]):
+        """Queue message for the worker without blocking log processing"""
         try:
-            response = requests.post(
-                self.webhook_url,
-                json=message,
-                timeout=10
-            )
+            self.alert_queue.put_nowait((alert_type, message))
+        except asyncio.QueueFull:
+            logger.error(f"Slack alert queue full - dropping {alert_type} alert")
+    
+    async def _alert_worker(self):
+        """Deliver queued messages to Slack, batching bursts by alert type"""
+        while True:
+            items = [await self.alert_queue.get()]
+            deadline = time.monotonic() + ALERT_BATCH_WINDOW
+            
+            while len(items) < ALERT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self.alert_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            for message, count in squash_payloads(items):
+                if count > 1:
+                    message = dict(message, text=f"[Num Alerts: {count}] {message['text']}")
+                await self._send_message(message)
+    
+    async def _send_message(self, message: Dict[str, Any]):
+        """Send message to Slack webhook, retrying rate limits and server errors"""
+        try:
+            for attempt in range(SLACK_MAX_RETRIES + 1):
+                response = await self.http.post(self.webhook_url, json=message)
+                if response.status_code not in SLACK_RETRY_STATUSES or attempt == SLACK_MAX_RETRIES:
+                    break
+                await asyncio.sleep(SLACK_RETRY_BACKOFF * 2 ** attempt)
+            
             response.raise_for_status()
             logger.info(f"Slack alert sent successfully")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to send Slack alert: {e}")
 
 class LogWatcher:
@@ -256,82 +419,227 @@ class LogWatcher:
         else:
             logger.warning("SLACK_WEBHOOK_URL not provided - alerts will be logged only")
     
-    def parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def parse_log_line(self, line: bytes) -> Optional[Dict[str, Any]]:
         """Parse JSON log line from nginx"""
+        # Only status and pool are used, so avoid decoding the whole entry
+        match = _FAST_FIELDS.search(line)
+        if match:
+            return {'status': int(match.group(1)), 'pool': match.group(2).decode()}
+        
         try:
-            log_entry = json.loads(line.strip())
+            log_entry = _loads(line)
             return log_entry
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.debug(f"Failed to parse log line: {e}")
             return None
     
+    def _extract_fields(self, entry: Dict[str, Any]) -> Tuple[int, str]:
+        """Return (status_code, pool) from a parsed log entry"""
+        # nginx emits status as a JSON number, so int() is usually skipped
+        status = entry.get('status')
+        status_code = status if type(status) is int else int(status) if status else 0
+        # Ignore values that cannot be HTTP status codes
+        if not 100 <= status_code <= 999:
+            status_code = 0
+        # Pool names are normally already lowercase and trimmed
+        pool_raw = entry.get('pool')
+        pool = pool_raw if pool_raw in _POOL_SET else (pool_raw.strip().lower() if pool_raw else '')
+        return status_code, pool
+    
+    def _handle_error_rate(self, exceeded: bool, recovered: bool, pool: str):
+        """Send error rate and recovery alerts"""
+        # High error rate alert
+        if exceeded:
+            if self.alert_manager.should_alert('error_rate'):
+                stats = self.error_monitor.get_current_stats()
+                logger.warning(f"High error rate detected: {stats}")
+                if self.slack_notifier:
+                    self.slack_notifier.send_error_rate_alert(stats)
+        
+        # Recovery alert
+        if recovered:
+            if self.alert_manager.should_alert('recovery'):
+                logger.info(f"Service recovered - error rate back to normal")
+                if self.slack_notifier:
+                    current_pool = pool if pool else 'unknown'
+                    self.slack_notifier.send_recovery_alert(current_pool)
+    
+    def _handle_pool(self, pool: str):
+        """Track pool changes and send failover alerts"""
+        previous_pool = self.pool_tracker.update_pool(pool)
+        if previous_pool:
+            if self.alert_manager.should_alert('failover'):
+                logger.warning(f"Failover detected: {previous_pool} → {pool}")
+                if self.slack_notifier:
+                    self.slack_notifier.send_failover_alert(previous_pool, pool)
+    
     def process_log_entry(self, entry: Dict[str, Any]):
         """Process a single log entry for alerts"""
-        try:
-            # Extract relevant fields
-            status_code = int(entry.get('status', 0))
-            pool = entry.get('pool', '').lower().strip()
-            upstream_status = entry.get('upstream_status', '')
+        self.process_log_entries([entry])
+    
+    def process_log_entries(self, entries: List[Dict[str, Any]]):
+        """Process a batch of log entries, checking thresholds once per batch"""
+        statuses = []
+        pool_changes = []  # Pools in order, with consecutive repeats collapsed
+        last_pool = ''
+        
+        for entry in entries:
+            try:
+                status_code, pool = self._extract_fields(entry)
+            except Exception as e:
+                logger.error(f"Error processing log entry: {e}")
+                continue
             
-            # Track error rates with recovery detection
             if status_code > 0:
-                exceeded, recovered = self.error_monitor.add_request(status_code)
-                
-                # High error rate alert
-                if exceeded:
-                    if self.alert_manager.should_alert('error_rate'):
-                        stats = self.error_monitor.get_current_stats()
-                        logger.warning(f"High error rate detected: {stats}")
-                        if self.slack_notifier:
-                            self.slack_notifier.send_error_rate_alert(stats)
-                
-                # Recovery alert
-                if recovered:
-                    if self.alert_manager.should_alert('recovery'):
-                        logger.info(f"Service recovered - error rate back to normal")
-                        if self.slack_notifier:
-                            current_pool = pool if pool else 'unknown'
-                            self.slack_notifier.send_recovery_alert(current_pool)
+                statuses.append(status_code)
+            if pool and pool != last_pool:
+                pool_changes.append(pool)
+                last_pool = pool
+        
+        try:
+            # Track error rates with recovery detection
+            if statuses:
+                exceeded, recovered = self.error_monitor.add_requests_bulk(
+                    np.array(statuses, dtype=np.int32)
+                )
+                self._handle_error_rate(exceeded, recovered, last_pool)
             
             # Track pool changes (failovers)
-            if pool:
-                previous_pool = self.pool_tracker.update_pool(pool)
-                if previous_pool:
-                    if self.alert_manager.should_alert('failover'):
-                        logger.warning(f"Failover detected: {previous_pool} → {pool}")
-                        if self.slack_notifier:
-                            self.slack_notifier.send_failover_alert(previous_pool, pool)
+            for pool in pool_changes:
+                self._handle_pool(pool)
             
         except Exception as e:
-            logger.error(f"Error processing log entry: {e}")
+            logger.error(f"Error processing log entries: {e}")
     
-    def tail_log_file(self, file_path: str):
+    async def tail_log_file(self, file_path: str):
         """Tail nginx log file and process entries"""
         logger.info(f"Starting to monitor log file: {file_path}")
+        start_at_end = True
         
         while True:
             try:
-                with open(file_path, 'r') as f:
-                    # Start from end of file
-                    f.seek(0, 2)
+                # Raw fd - reads go straight from the kernel, no Python buffering
+                fd = os.open(file_path, os.O_RDONLY | os.O_NONBLOCK)
+                try:
+                    # Start from end of file, or from the top after a rotation
+                    if start_at_end:
+                        os.lseek(fd, 0, os.SEEK_END)
                     
-                    while True:
-                        line = f.readline()
-                        if line:
-                            entry = self.parse_log_line(line)
-                            if entry:
-                                self.process_log_entry(entry)
-                        else:
-                            time.sleep(0.1)  # Brief pause when no new lines
+                    if INotify is None:
+                        await self._poll_log_file(fd)
+                    else:
+                        await self._watch_log_file(fd, file_path)
+                finally:
+                    os.close(fd)
+                
+                # File was moved or deleted - reopen the new one from the top
+                logger.info(f"Log file {file_path} rotated, reopening")
+                start_at_end = False
                             
             except FileNotFoundError:
                 logger.warning(f"Log file {file_path} not found, waiting...")
-                time.sleep(5)
+                start_at_end = False
+                await asyncio.sleep(5)
             except Exception as e:
                 logger.error(f"Error reading log file: {e}")
-                time.sleep(5)
+                await asyncio.sleep(5)
     
-    def run(self):
+    async def _read_new_lines(self, fd: int, pending: bytes) -> bytes:
+        """
+        Process every complete line currently available in the file
+        Returns: trailing partial line to prepend to the next read
+        """
+        while True:
+            try:
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+            except BlockingIOError:
+                chunk = b''
+            if not chunk:
+                return pending
+            
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            entries = []
+            for line in lines:
+                if not line:
+                    continue
+                entry = self.parse_log_line(line)
+                if entry:
+                    entries.append(entry)
+            if entries:
+                self.process_log_entries(entries)
+            
+            # Let the Slack worker run between chunks during bursts
+            await asyncio.sleep(0)
+    
+    def _is_rotated(self, fd: int, file_path: str) -> bool:
+        """Check whether the open fd no longer refers to the file at file_path"""
+        if os.fstat(fd).st_nlink == 0:
+            return True
+        try:
+            return os.stat(file_path).st_ino != os.fstat(fd).st_ino
+        except FileNotFoundError:
+            return True
+    
+    async def _watch_log_file(self, fd: int, file_path: str):
+        """Wait on inotify events from the event loop and read new lines"""
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        
+        with INotify() as inotify:
+            # DELETE_SELF only fires once our fd is closed, so unlinks are
+            # detected through ATTRIB (link count change) instead
+            inotify.add_watch(
+                file_path,
+                flags.MODIFY | flags.ATTRIB | flags.MOVE_SELF | flags.DELETE_SELF
+            )
+            loop.add_reader(inotify.fileno(), ready.set)
+            
+            try:
+                # Catch anything written between open() and add_watch()
+                pending = await self._read_new_lines(fd, b'')
+                
+                while True:
+                    try:
+                        await asyncio.wait_for(ready.wait(), 5)
+                    except asyncio.TimeoutError:
+                        pass
+                    ready.clear()
+                    
+                    events = inotify.read(timeout=0)
+                    pending = await self._read_new_lines(fd, pending)
+                    
+                    # Re-check the path on timeouts too, in case the file was
+                    # replaced without an event reaching this watch
+                    rotated = not events or any(
+                        event.mask & (flags.ATTRIB | flags.MOVE_SELF | flags.DELETE_SELF)
+                        for event in events
+                    )
+                    if rotated and self._is_rotated(fd, file_path):
+                        # Drain lines written to the old file after the rotation
+                        await self._read_new_lines(fd, pending)
+                        return
+            finally:
+                loop.remove_reader(inotify.fileno())
+    
+    async def _poll_log_file(self, fd: int):
+        """
+        Poll the file for new lines when inotify is unavailable
+        Backs off exponentially from 1 ms to 200 ms while the file is idle
+        """
+        pending = b''
+        sleep_ms = 1
+        while True:
+            position = os.lseek(fd, 0, os.SEEK_CUR)
+            pending = await self._read_new_lines(fd, pending)
+            
+            if os.lseek(fd, 0, os.SEEK_CUR) != position:
+                sleep_ms = 1
+            else:
+                sleep_ms = min(sleep_ms * 2, 200)
+            await asyncio.sleep(sleep_ms / 1000)
+    
+    async def run(self):
         """Main run loop"""
         log_file = "/shared/logs/nginx_observability.log"
         
@@ -342,14 +650,21 @@ class LogWatcher:
         logger.info(f"  Alert cooldown: {self.cooldown_seconds} seconds")
         logger.info(f"  Log file: {log_file}")
         
+        if self.slack_notifier:
+            self.slack_notifier.start()
+        
         # Start log monitoring
-        self.tail_log_file(log_file)
+        try:
+            await self.tail_log_file(log_file)
+        finally:
+            if self.slack_notifier:
+                await self.slack_notifier.close()
 
 def main():
     """Entry point"""
     try:
         watcher = LogWatcher()
-        watcher.run()
+        asyncio.run(watcher.run())
     except KeyboardInterrupt:
         logger.info("Shutting down log watcher")
     except Exception as e: